@@ -1,10 +1,35 @@
 from abc import ABC
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from builda_client.exceptions import ClientException, ServerException, UnauthorizedException
 
 class BaseClient(ABC):
+    def __init__(self):
+        # Reuse one connection pool for all requests to avoid repeated TCP/TLS setup
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            # Only retry failed connection attempts: the read timeouts are long
+            # and a retried read would run a heavy server query again
+            max_retries=Retry(total=3, connect=3, read=0, backoff_factor=0.2),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Closes the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
     def handle_exception(self, err: requests.exceptions.HTTPError):
             if err.response.status_code == 403:
                 raise UnauthorizedException(
@@ -15,4 +40,4 @@ class BaseClient(ABC):
             if err.response.status_code >= 400 and err.response.status_code <= 499:
                 raise ClientException("A client side error occured", err) from err
 
-            raise ServerException("An unexpected error occurred. Please contact administrator.", err) from err
\ No newline at end of file
+            raise ServerException("An unexpected error occurred. Please contact administrator.", err) from err
@@ -1,9 +1,14 @@
-import json
 import logging
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 import requests
 from shapely.geometry import Polygon
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
 from builda_client.base_client import BaseClient
 from builda_client.util import load_config
 from builda_client.model import (
@@ -32,7 +37,7 @@ from builda_client.model import (
     RefurbishmentStateStatistics,
     StringSource,
 )
-from builda_client.util import determine_nuts_query_param
+from builda_client.util import determine_nuts_query_param, json_loads
 
 
 class BuildaClient(BaseClient):
@@ -68,6 +73,7 @@ class BuildaClient(BaseClient):
         Forschungszentrum Jülich - Jülich Systems Analysis (IEK-3) available
         at https://ethos-builda.fz-juelich.de.
         """
+        super().__init__()
         self.config = load_config()
         self.BASE_URL = self.config["production"]["api_address"] + self.config["base_url"]
         logging.basicConfig(level=logging.WARN)
@@ -116,18 +122,11 @@ class BuildaClient(BaseClient):
             nuts_code,
             building_type,
         )
-        nuts_query_param: str = determine_nuts_query_param(nuts_code)
-
-        type_is_null = "False"
-        if building_type is None:
-            type_is_null = "True"
-            building_type = ""
-        elif building_type == '':
-            type_is_null = ""
-
-        url: str = f"""{self.BASE_URL}{self.BUILDINGS_URL}?street={street}&house_number={housenumber}&postcode={postcode}&city={city}&{nuts_query_param}={nuts_code}&type={building_type}&type__isnull={type_is_null}"""
+        url: str = self.__get_buildings_url(
+            building_type, street, housenumber, postcode, city, nuts_code
+        )
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             logging.debug("ApiClient: received response. Checking for errors.")
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
@@ -136,55 +135,10 @@ class BuildaClient(BaseClient):
         logging.debug(
             "ApiClient: received ok response, proceeding with deserialization."
         )
-        results: Dict = json.loads(response.content)
+        results: Dict = json_loads(response.content)
         buildings: list[BuildingWithSourceDto] = []
         for result in results["buildings"]:
-            coordinates = CoordinatesSource(
-                value = Coordinates(
-                    latitude=result["coordinates"]["value"]["latitude"],
-                    longitude=result["coordinates"]["value"]["longitude"]
-                ),
-                source = result["coordinates"]["source"],
-                lineage = result["coordinates"]["lineage"],
-            )
-            address = AddressSource(
-                value = Address(
-                    street = result["address"]["value"]["street"],
-                    house_number = result["address"]["value"]["house_number"],
-                    postcode = result["address"]["value"]["postcode"],
-                    city = result["address"]["value"]["city"],
-                ),
-                source = result["address"]["source"],
-                lineage = result["address"]["lineage"],
-            )
-
-            building = BuildingWithSourceDto(
-                id=result["id"],
-                coordinates=coordinates,
-                address=address,
-                footprint_area_m2=result["footprint_area_m2"],
-                height_m=FloatSource(
-                    value=result["height_m"]["value"], 
-                    source=result["height_m"]["source"],
-                    lineage=result["height_m"]["lineage"],
-                    ),
-                elevation_m=FloatSource(
-                    value=result["elevation_m"]["value"], 
-                    source=result["elevation_m"]["source"],
-                    lineage=result["elevation_m"]["lineage"],
-                    ),
-                type=StringSource(
-                    value=result["type"]["value"], 
-                    source=result["type"]["source"],
-                    lineage=result["type"]["lineage"],
-                    ),
-                roof_shape=StringSource(
-                    value=result["roof_shape"]["value"], 
-                    source=result["roof_shape"]["source"],
-                    lineage=result["roof_shape"]["lineage"],
-                    ),
-            )
-            buildings.append(building)
+            buildings.append(self.__to_building(result))
 
         data_sources: list[SourceResponseDto] = []
         for entry in results["sources"]:
@@ -213,6 +167,126 @@ class BuildaClient(BaseClient):
             sources=data_sources, 
             lineages=lineages)
 
+    def iter_buildings(
+        self,
+        building_type: Optional[str] = "",
+        street: str = "",
+        housenumber: str = "",
+        postcode: str = "",
+        city: str = "",
+        nuts_code: str = "",
+    ) -> Iterator[BuildingWithSourceDto]:
+        """Lazily yields all buildings that match the query parameters with the basic
+        attributes common to all building use types. Unlike get_buildings, the
+        response is parsed while it is downloaded if the optional dependency ijson is
+        installed, so that large results do not have to be held in memory at once.
+        The lists of sources and lineages returned by get_buildings are not included.
+
+        The request is only sent once the first building is requested.
+
+        Args:
+            building_type (str): The type of building ('residential', 'non-residential', 'mixed').
+            street (str, optional): The name of the street. Defaults to "".
+            housenumber (str, optional): The house number. Defaults to "".
+            postcode (str, optional): The postcode. Defaults to "".
+            city (str, optional): The city. Defaults to "".
+            nuts_code (str, optional): The NUTS-code, e.g. 'DE' for Germany
+                according to the 2021 NUTS code definitions or 2019 LAU definition.
+                Defaults to None.
+
+        Raises:
+            ServerException: When an error occurs on the server side..
+
+        Yields:
+            BuildingWithSourceDto: The buildings with attribute sources and lineages.
+        """
+        url: str = self.__get_buildings_url(
+            building_type, street, housenumber, postcode, city, nuts_code
+        )
+        response: requests.Response = self.session.get(url, timeout=3600, stream=True)
+        # Release the streamed connection to the pool on errors as well
+        with response:
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as err:
+                self.handle_exception(err)
+
+            if ijson is None:
+                results = json_loads(response.content)["buildings"]
+            else:
+                response.raw.decode_content = True
+                results = ijson.items(response.raw, "buildings.item", use_float=True)
+
+            for result in results:
+                yield self.__to_building(result)
+
+    def __get_buildings_url(
+        self,
+        building_type: Optional[str],
+        street: str,
+        housenumber: str,
+        postcode: str,
+        city: str,
+        nuts_code: str,
+    ) -> str:
+        nuts_query_param: str = determine_nuts_query_param(nuts_code)
+
+        type_is_null = "False"
+        if building_type is None:
+            type_is_null = "True"
+            building_type = ""
+        elif building_type == '':
+            type_is_null = ""
+
+        return f"""{self.BASE_URL}{self.BUILDINGS_URL}?street={street}&house_number={housenumber}&postcode={postcode}&city={city}&{nuts_query_param}={nuts_code}&type={building_type}&type__isnull={type_is_null}"""
+
+    def __to_building(self, result: Dict) -> BuildingWithSourceDto:
+        coordinates = CoordinatesSource(
+            value = Coordinates(
+                latitude=result["coordinates"]["value"]["latitude"],
+                longitude=result["coordinates"]["value"]["longitude"]
+            ),
+            source = result["coordinates"]["source"],
+            lineage = result["coordinates"]["lineage"],
+        )
+        address = AddressSource(
+            value = Address(
+                street = result["address"]["value"]["street"],
+                house_number = result["address"]["value"]["house_number"],
+                postcode = result["address"]["value"]["postcode"],
+                city = result["address"]["value"]["city"],
+            ),
+            source = result["address"]["source"],
+            lineage = result["address"]["lineage"],
+        )
+
+        return BuildingWithSourceDto(
+            id=result["id"],
+            coordinates=coordinates,
+            address=address,
+            footprint_area_m2=result["footprint_area_m2"],
+            height_m=FloatSource(
+                value=result["height_m"]["value"], 
+                source=result["height_m"]["source"],
+                lineage=result["height_m"]["lineage"],
+                ),
+            elevation_m=FloatSource(
+                value=result["elevation_m"]["value"], 
+                source=result["elevation_m"]["source"],
+                lineage=result["elevation_m"]["lineage"],
+                ),
+            type=StringSource(
+                value=result["type"]["value"], 
+                source=result["type"]["source"],
+                lineage=result["type"]["lineage"],
+                ),
+            roof_shape=StringSource(
+                value=result["roof_shape"]["value"], 
+                source=result["roof_shape"]["source"],
+                lineage=result["roof_shape"]["lineage"],
+                ),
+        )
+
     
     def get_residential_buildings(
         self,
@@ -256,7 +330,7 @@ class BuildaClient(BaseClient):
 
         url: str = f"""{self.BASE_URL}{self.RESIDENTIAL_BUILDINGS_URL}?street={street}&house_number={housenumber}&postcode={postcode}&city={city}&{nuts_query_param}={nuts_code}&type={building_type}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             logging.debug("ApiClient: received response. Checking for errors.")
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
@@ -265,7 +339,7 @@ class BuildaClient(BaseClient):
         logging.debug(
             "ApiClient: received ok response, proceeding with deserialization."
         )
-        results: Dict = json.loads(response.content)
+        results: Dict = json_loads(response.content)
         buildings: list[ResidentialBuildingWithSourceDto] = []
         for result in results["buildings"]:
             coordinates = CoordinatesSource(
@@ -426,7 +500,7 @@ class BuildaClient(BaseClient):
 
         url: str = f"""{self.BASE_URL}{self.NON_RESIDENTIAL_BUILDINGS_URL}?street={street}&house_number={housenumber}&postcode={postcode}&city={city}&{nuts_query_param}={nuts_code}&type={building_type}&exclude_auxiliary={exclude_auxiliary}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             logging.debug("ApiClient: received response. Checking for errors.")
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
@@ -435,7 +509,7 @@ class BuildaClient(BaseClient):
         logging.debug(
             "ApiClient: received ok response, proceeding with deserialization."
         )
-        results: Dict = json.loads(response.content)
+        results: Dict = json_loads(response.content)
         buildings: list[NonResidentialBuildingWithSourceDto] = []
         for result in results["buildings"]:
             coordinates = CoordinatesSource(
@@ -545,12 +619,12 @@ class BuildaClient(BaseClient):
 
         url: str = f"""{self.BASE_URL}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list[Dict] = json.loads(response.content)
+        results: list[Dict] = json_loads(response.content)
         statistics: list[BuildingStatistics] = []
         for result in results:
             statistic = BuildingStatistics(
@@ -602,12 +676,12 @@ class BuildaClient(BaseClient):
 
         url: str = f"""{self.BASE_URL}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[BuildingUseStatistics] = []
         for res in results:
             statistic = BuildingUseStatistics(
@@ -657,12 +731,12 @@ class BuildaClient(BaseClient):
 
         url: str = f"""{self.BASE_URL}{self.RESIDENTIAL_SIZE_CLASS_STATISTICS_URL}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[SizeClassStatistics] = []
         for res in results:
             statistic = SizeClassStatistics(
@@ -715,12 +789,12 @@ class BuildaClient(BaseClient):
             f"""{self.BASE_URL}{self.CONSTRUCTION_YEAR_STATISTICS_URL}{query_params}"""
         )
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[ConstructionYearStatistics] = []
         for res in results:
             statistic = ConstructionYearStatistics(
@@ -769,12 +843,12 @@ class BuildaClient(BaseClient):
 
         url: str = f"""{self.BASE_URL}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[FootprintAreaStatistics] = []
         for res in results:
             statistic = FootprintAreaStatistics(
@@ -846,12 +920,12 @@ class BuildaClient(BaseClient):
 
         url: str = f"""{self.BASE_URL}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[HeightStatistics] = []
         for res in results:
             statistic = HeightStatistics(
@@ -917,12 +991,12 @@ class BuildaClient(BaseClient):
 
         url: str = f"""{self.BASE_URL}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url)
+            response: requests.Response = self.session.get(url)
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[RefurbishmentStateStatistics] = []
         for res in results:
             statistic = RefurbishmentStateStatistics(
@@ -979,12 +1053,12 @@ class BuildaClient(BaseClient):
 
         url: str = f"""{self.BASE_URL}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[HeatDemandStatistics] = []
         for res in results:
             statistic = HeatDemandStatistics(
@@ -1040,12 +1114,12 @@ class BuildaClient(BaseClient):
 
         url: str = f"""{self.BASE_URL}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600)
+            response: requests.Response = self.session.get(url, timeout=3600)
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[HeatDemandStatisticsByBuildingCharacteristics] = []
         for res in results:
             statistic = HeatDemandStatisticsByBuildingCharacteristics(
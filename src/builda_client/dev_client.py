@@ -72,7 +72,7 @@ from builda_client.dev_model import (
     EnergyCommodityStatistics,
     PvPotentialStatistics,
 )
-from builda_client.util import determine_nuts_query_param, ewkt_loads
+from builda_client.util import determine_nuts_query_param, ewkt_loads, json_loads
 
 class Phase(Enum):
     LOCAL = "local",
@@ -205,7 +205,15 @@ class BuildaDevClient(BaseClient):
       
         self.base_url = f"""{address}{self.config['base_url']}"""
         self.authentication_url = f"""{address}{self.AUTH_URL}"""
-        self.api_token = self.__get_authentication_token()
+        self._api_token: Optional[str] = None
+
+    @property
+    def api_token(self) -> str:
+        """The API token, which is retrieved from the token endpoint on first use and
+        reused afterwards. Empty if username and/or password were not provided."""
+        if self._api_token is None:
+            self._api_token = self.__get_authentication_token()
+        return self._api_token
 
     def __get_authentication_token(self) -> str:
         """Retrieves the authentication token for the given username and password from the token endpoint.
@@ -225,11 +233,11 @@ class BuildaDevClient(BaseClient):
             return ""
         url: str = f"""{self.authentication_url}"""
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url, data={"username": self.username, "password": self.password}
             )
             response.raise_for_status()
-            return json.loads(response.content)["token"]
+            return json_loads(response.content)["token"]
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
@@ -289,7 +297,7 @@ class BuildaDevClient(BaseClient):
             url += f"&geom={geom}"
 
         try:
-            response: requests.Response = requests.get(url, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, headers=self.__construct_authorization_header())
             logging.debug("ApiClient: received response. Checking for errors.")
             response.raise_for_status()
         except requests.HTTPError as e:
@@ -362,7 +370,7 @@ class BuildaDevClient(BaseClient):
             url += f"&id__in={','.join(ids)}"
 
         try:
-            response: requests.Response = requests.get(url, timeout=3600, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, timeout=3600, headers=self.__construct_authorization_header())
             logging.debug("ApiClient: received response. Checking for errors.")
             response.raise_for_status()
         except requests.HTTPError as err:
@@ -371,7 +379,7 @@ class BuildaDevClient(BaseClient):
         logging.debug(
             "ApiClient: received ok response, proceeding with deserialization."
         )
-        results: list[Dict] = json.loads(response.content)
+        results: list[Dict] = json_loads(response.content)
         buildings: list[Building] = []
         for result in results:
             coordinates = Coordinates(
@@ -447,7 +455,7 @@ class BuildaDevClient(BaseClient):
 
         url: str = f"""{self.base_url}{self.RESIDENTIAL_BUILDINGS_URL}?street={street}&house_number={housenumber}&postcode={postcode}&city={city}&{nuts_query_param}={nuts_code}&type={building_type}"""
         try:
-            response: requests.Response = requests.get(
+            response: requests.Response = self.session.get(
                 url, 
                 timeout=3600, 
                 headers=self.__construct_authorization_header()
@@ -460,7 +468,7 @@ class BuildaDevClient(BaseClient):
         logging.debug(
             "ApiClient: received ok response, proceeding with deserialization."
         )
-        results: list[Dict] = json.loads(response.content)
+        results: list[Dict] = json_loads(response.content)
         buildings: list[ResidentialBuilding] = []
         for result in results:
             coordinates = Coordinates(
@@ -542,7 +550,7 @@ class BuildaDevClient(BaseClient):
 
         url: str = f"""{self.base_url}{self.RESIDENTIAL_BUILDINGS_WITH_SOURCES_URL}?street={street}&house_number={housenumber}&postcode={postcode}&city={city}&{nuts_query_param}={nuts_code}&type={building_type}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, timeout=3600, headers=self.__construct_authorization_header())
             logging.debug("ApiClient: received response. Checking for errors.")
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
@@ -551,7 +559,7 @@ class BuildaDevClient(BaseClient):
         logging.debug(
             "ApiClient: received ok response, proceeding with deserialization."
         )
-        results: Dict = json.loads(response.content)
+        results: Dict = json_loads(response.content)
         buildings: list[ResidentialBuildingWithSourceDto] = []
         for result in results["buildings"]:
             coordinates = CoordinatesSource(
@@ -747,7 +755,7 @@ class BuildaDevClient(BaseClient):
         if geom:
             url += f"&geom={geom}"
         try:
-            response: requests.Response = requests.get(
+            response: requests.Response = self.session.get(
                 url, 
                 timeout=3600,
                 headers=self.__construct_authorization_header())
@@ -759,7 +767,7 @@ class BuildaDevClient(BaseClient):
         logging.debug(
             "ApiClient: received ok response, proceeding with deserialization."
         )
-        results: list[Dict] = json.loads(response.content)
+        results: list[Dict] = json_loads(response.content)
         buildings: list[NonResidentialBuilding] = []
         for result in results:
             coordinates = Coordinates(
@@ -814,7 +822,7 @@ class BuildaDevClient(BaseClient):
             url += f"&geom={geom}"
 
         try:
-            response: requests.Response = requests.get(url, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, headers=self.__construct_authorization_header())
             logging.debug("ApiClient: received response. Checking for errors.")
             response.raise_for_status()
         except requests.HTTPError as err:
@@ -844,7 +852,7 @@ class BuildaDevClient(BaseClient):
             url += f"&geom={geom}"
             
         try:
-            response: requests.Response = requests.get(url, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, headers=self.__construct_authorization_header())
             logging.debug("ApiClient: received response. Checking for errors.")
             response.raise_for_status()
         except requests.HTTPError as e:
@@ -853,15 +861,15 @@ class BuildaDevClient(BaseClient):
         logging.debug(
             "ApiClient: received ok response, proceeding with deserialization."
         )
-        building_ids: list[str] = json.loads(response.content)
+        building_ids: list[str] = json_loads(response.content)
 
         return building_ids
 
     def __deserialize(self, response_content):
-        results: list[str] = json.loads(response_content)
+        results: list[str] = json_loads(response_content)
         buildings: list[BuildingBase] = []
         for res_json in results:
-            res = json.loads(res_json)
+            res = json_loads(res_json)
             building = BuildingBase(
                 id=res["id"],
                 footprint=shape(res["footprint"]),
@@ -872,10 +880,10 @@ class BuildaDevClient(BaseClient):
         return buildings
 
     def __deserialize_buildings_parcel(self, response_content):
-        results: list[str] = json.loads(response_content)
+        results: list[str] = json_loads(response_content)
         buildings: list[BuildingParcel] = []
         for res_json in results:
-            res = json.loads(res_json)
+            res = json_loads(res_json)
             parcel: ParcelMinimalDto | None = None
             if res["parcel_id"] != "None" and res["parcel_geom"] != "None":
                 parcel = ParcelMinimalDto(
@@ -905,7 +913,7 @@ class BuildaDevClient(BaseClient):
             url += f"?ids={id_str}"
 
         try:
-            response: requests.Response = requests.get(
+            response: requests.Response = self.session.get(
                 url, headers=self.__construct_authorization_header()
             )
             response.raise_for_status()
@@ -917,7 +925,7 @@ class BuildaDevClient(BaseClient):
             else:
                 raise ServerException("An unexpected error occured.")
 
-        results: Dict = json.loads(response.content)
+        results: Dict = json_loads(response.content)
         parcels: list[Parcel] = []
 
         for result in results:
@@ -939,7 +947,7 @@ class BuildaDevClient(BaseClient):
 
         parcel_infos_json = json.dumps(parcel_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=parcel_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -963,7 +971,7 @@ class BuildaDevClient(BaseClient):
 
         parcels_json = json.dumps(parcels, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url, data=parcels_json, headers=self.__construct_authorization_header()
             )
             response.raise_for_status()
@@ -979,7 +987,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.BUILDING_STOCK_URL}/{building_id}"""
         building_json = json.dumps(building_data)
         try:
-            response: requests.Response = requests.put(
+            response: requests.Response = self.session.put(
                 url, data=building_json, headers=self.__construct_authorization_header()
             )
             response.raise_for_status()
@@ -1014,7 +1022,7 @@ class BuildaDevClient(BaseClient):
 
         url: str = f"""{self.base_url}{self.VIEW_REFRESH_URL}/{view_name}"""
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url, headers=self.__construct_authorization_header(json=False)
             )
             response.raise_for_status()
@@ -1041,7 +1049,7 @@ class BuildaDevClient(BaseClient):
 
         url: str = f"""{self.base_url}{self.VIEW_REFRESH_URL}/{view_name}"""
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url, headers=self.__construct_authorization_header(json=False)
             )
             response.raise_for_status()
@@ -1088,7 +1096,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.BUILDING_STOCK_URL}{query_params}"""
 
         try:
-            response: requests.Response = requests.get(
+            response: requests.Response = self.session.get(
                 url, headers=self.__construct_authorization_header()
             )
             response.raise_for_status()
@@ -1101,7 +1109,7 @@ class BuildaDevClient(BaseClient):
                 raise ServerException("An unexpected error occured.")
 
         buildings: list[BuildingStockEntry] = []
-        results: Dict = json.loads(response.content)
+        results: Dict = json_loads(response.content)
         for result in results:
             building = BuildingStockEntry(
                 building_id=result["building_id"],
@@ -1142,7 +1150,7 @@ class BuildaDevClient(BaseClient):
 
         buildings_json = json.dumps(buildings, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=buildings_json,
                 headers=self.__construct_authorization_header(),
@@ -1200,7 +1208,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.BUILDINGS_GEOMETRY_URL}{query_params}"""
 
         try:
-            response: requests.Response = requests.get(
+            response: requests.Response = self.session.get(
                 url, headers=self.__construct_authorization_header()
             )
             response.raise_for_status()
@@ -1213,9 +1221,9 @@ class BuildaDevClient(BaseClient):
                 raise ServerException("An unexpected error occured.")
 
         buildings: list[BuildingGeometry] = []
-        results: Dict = json.loads(response.content)
+        results: Dict = json_loads(response.content)
         for result_json in results:
-            result = json.loads(result_json)
+            result = json_loads(result_json)
             building = BuildingGeometry(
                 id=result["id"],
                 footprint=shape(result["footprint"]),
@@ -1260,7 +1268,7 @@ class BuildaDevClient(BaseClient):
         nuts_regions_json = json.dumps(nuts_regions, cls=EnhancedJSONEncoder)
 
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=nuts_regions_json,
                 headers=self.__construct_authorization_header(),
@@ -1293,7 +1301,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.ADDRESS_URL}"""
         addresses_json = json.dumps(addresses, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=addresses_json,
                 headers=self.__construct_authorization_header(),
@@ -1328,7 +1336,7 @@ class BuildaDevClient(BaseClient):
 
         type_infos_json = json.dumps(type_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=type_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1363,7 +1371,7 @@ class BuildaDevClient(BaseClient):
 
         use_infos_json = json.dumps(use_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=use_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1396,7 +1404,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.HEIGHT_URL}"""
         height_infos_json = json.dumps(height_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=height_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1429,7 +1437,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.ELEVATION_URL}"""
         infos_json = json.dumps(infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1462,7 +1470,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.FLOOR_AREAS_URL}"""
         floor_areas_infos_json = json.dumps(floor_areas_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=floor_areas_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1497,7 +1505,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.OCCUPANCY_URL}"""
         occupancy_infos_json = json.dumps(occupancy_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=occupancy_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1537,7 +1545,7 @@ class BuildaDevClient(BaseClient):
             energy_system_infos, cls=EnhancedJSONEncoder
         )
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=energy_system_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1576,7 +1584,7 @@ class BuildaDevClient(BaseClient):
             energy_consumption_infos, cls=EnhancedJSONEncoder
         )
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=energy_consumption_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1609,7 +1617,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.HEAT_DEMAND_URL}"""
         heat_demand_infos_json = json.dumps(heat_demand_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=heat_demand_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1642,7 +1650,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.NORM_HEATING_LOAD_URL}"""
         heating_load_infos_json = json.dumps(heating_load_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=heating_load_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1674,7 +1682,7 @@ class BuildaDevClient(BaseClient):
             pv_potential_infos, cls=EnhancedJSONEncoder
         )
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=pv_potential_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1708,7 +1716,7 @@ class BuildaDevClient(BaseClient):
             construction_year_infos, cls=EnhancedJSONEncoder
         )
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=construction_year_json,
                 headers=self.__construct_authorization_header(),
@@ -1738,7 +1746,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.TABULA_TYPE_URL}"""
         tabula_type_json = json.dumps(tabula_type_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=tabula_type_json,
                 headers=self.__construct_authorization_header(),
@@ -1770,7 +1778,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.SIZE_CLASS_URL}"""
         size_class_json = json.dumps(size_class_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=size_class_json,
                 headers=self.__construct_authorization_header(),
@@ -1804,7 +1812,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.ADDITIONAL_URL}"""
         additional_infos_json = json.dumps(additional_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=additional_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1824,7 +1832,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.TIMING_LOG_URL}"""
 
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=json.dumps(
                     {"function_name": function_name, "measured_time": measured_time}
@@ -1839,7 +1847,7 @@ class BuildaDevClient(BaseClient):
         logging.debug("ApiClient: get_nuts_region")
         url: str = f"""{self.base_url}{self.NUTS_URL}/{nuts_code}"""
         try:
-            response: requests.Response = requests.get(url, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, headers=self.__construct_authorization_header())
             response.raise_for_status()
         except requests.HTTPError as e:
             if e.response.status_code == 403:
@@ -1849,7 +1857,7 @@ class BuildaDevClient(BaseClient):
             else:
                 raise ServerException("An unexpected error occured.")
 
-        response_content: Dict = json.loads(response.content)
+        response_content: Dict = json_loads(response.content)
 
         nuts_region = NutsRegion(
             code=response_content["code"],
@@ -1867,7 +1875,7 @@ class BuildaDevClient(BaseClient):
             f"""{self.base_url}{self.NUTS_CODES_URL}?parent={parent_region_code}"""
         )
         try:
-            response: requests.Response = requests.get(url, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, headers=self.__construct_authorization_header())
             response.raise_for_status()
         except requests.HTTPError as e:
             if e.response.status_code == 403:
@@ -1877,7 +1885,7 @@ class BuildaDevClient(BaseClient):
             else:
                 raise ServerException("An unexpected error occured.")
 
-        return json.loads(response.content)
+        return json_loads(response.content)
 
     def post_refurbishment_state(
         self, refurbishment_state_infos: list[RefurbishmentStateInfo]
@@ -1904,7 +1912,7 @@ class BuildaDevClient(BaseClient):
             refurbishment_state_infos, cls=EnhancedJSONEncoder
         )
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=refurbishment_state_infos_json,
                 headers=self.__construct_authorization_header(),
@@ -1934,7 +1942,7 @@ class BuildaDevClient(BaseClient):
         url: str = f"""{self.base_url}{self.ROOF_CHARACTERISTICS_INFO_URL}"""
         roof_characteristics_json = json.dumps(roof_characteristics_infos, cls=EnhancedJSONEncoder)
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=roof_characteristics_json,
                 headers=self.__construct_authorization_header(),
@@ -1968,7 +1976,7 @@ class BuildaDevClient(BaseClient):
             metadata, cls=EnhancedJSONEncoder
         )
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=metadata_json,
                 headers=self.__construct_authorization_header(),
@@ -2002,7 +2010,7 @@ class BuildaDevClient(BaseClient):
             lineage, cls=EnhancedJSONEncoder
         )
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data=metadata_json,
                 headers=self.__construct_authorization_header(),
@@ -2033,13 +2041,13 @@ class BuildaDevClient(BaseClient):
 
         url: str = f"""{self.base_url}{self.CUSTOM_QUERY_URL}"""
         try:
-            response: requests.Response = requests.post(
+            response: requests.Response = self.session.post(
                 url,
                 data={"query": query},
                 headers=self.__construct_authorization_header(json=False),
             )
             response.raise_for_status()
-            return json.loads(response.content)
+            return json_loads(response.content)
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
@@ -2101,12 +2109,12 @@ class BuildaDevClient(BaseClient):
 
         url: str = f"""{self.base_url}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, timeout=3600, headers=self.__construct_authorization_header())
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[NonResidentialEnergyConsumptionStatistics] = []
         for res in results:
             statistic = NonResidentialEnergyConsumptionStatistics(
@@ -2180,12 +2188,12 @@ class BuildaDevClient(BaseClient):
 
         url: str = f"""{self.base_url}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, timeout=3600, headers=self.__construct_authorization_header())
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[EnergyCommodityStatistics] = []
         for res in results:
          
@@ -2237,12 +2245,12 @@ class BuildaDevClient(BaseClient):
 
         url: str = f"""{self.base_url}{self.PV_GENERATION_POTENTIAL_STATISTICS_URL}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, timeout=3600, headers=self.__construct_authorization_header())
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[PvPotentialStatistics] = []
         for res in results:
             statistic = PvPotentialStatistics(
@@ -2310,12 +2318,12 @@ def get_building_type_statistics(
 
         url: str = f"""{self.base_url}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, timeout=3600, headers=self.__construct_authorization_header())
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list[Dict] = json.loads(response.content)
+        results: list[Dict] = json_loads(response.content)
         statistics: list[BuildingStatistics] = []
         for result in results:
             statistic = BuildingStatistics(
@@ -2378,12 +2386,12 @@ def get_non_residential_building_use_statistics(
 
         url: str = f"""{self.base_url}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, timeout=3600, headers=self.__construct_authorization_header())
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[BuildingUseStatistics] = []
         for res in results:
             statistic = BuildingUseStatistics(
@@ -2445,12 +2453,12 @@ def get_footprint_area_statistics(
 
         url: str = f"""{self.base_url}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, timeout=3600, headers=self.__construct_authorization_header())
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[FootprintAreaStatistics] = []
         for res in results:
             statistic = FootprintAreaStatistics(
@@ -2533,12 +2541,12 @@ def get_height_statistics(
 
         url: str = f"""{self.base_url}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, timeout=3600, headers=self.__construct_authorization_header())
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[HeightStatistics] = []
         for res in results:
             statistic = HeightStatistics(
@@ -2611,12 +2619,12 @@ def get_residential_heat_demand_statistics(
 
         url: str = f"""{self.base_url}{statistics_url}{query_params}"""
         try:
-            response: requests.Response = requests.get(url, timeout=3600, headers=self.__construct_authorization_header())
+            response: requests.Response = self.session.get(url, timeout=3600, headers=self.__construct_authorization_header())
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             self.handle_exception(err)
 
-        results: list = json.loads(response.content)
+        results: list = json_loads(response.content)
         statistics: list[HeatDemandStatistics] = []
         for res in results:
             statistic = HeatDemandStatistics(
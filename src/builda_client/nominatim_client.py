@@ -5,12 +5,13 @@ from typing import Dict, Tuple
 import numpy as np
 import requests
 
+from builda_client.base_client import BaseClient
 from builda_client.exceptions import (GeocodeException, ServerException,
                                       UnauthorizedException)
 from builda_client.util import load_config
 
 
-class NominatimClient:
+class NominatimClient(BaseClient):
     def __init__(self, proxy: bool = False):
         """Constructor.
 
@@ -18,6 +19,7 @@ class NominatimClient:
             proxy (bool, optional): Whether to use a proxy or not. Proxy should be used 
                 when using client on cluster compute nodes. Defaults to False.
         """
+        super().__init__()
         logging.basicConfig(level=logging.WARN)
 
         self.config = load_config()
@@ -39,7 +41,7 @@ class NominatimClient:
 
         url: str = f"""{self.address}/reverse/?lat={lat_str}&lon={lon_str}&zoom=18&format=geocodejson"""
         try:
-            response: requests.Response = requests.get(url)
+            response: requests.Response = self.session.get(url)
             response.raise_for_status()
         except requests.HTTPError as e:
             if e.response.status_code == 403:
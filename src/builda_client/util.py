@@ -1,10 +1,16 @@
+import json
 import re
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
 
 import yaml
 from shapely import wkt
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 def load_config() -> Dict:
     """Loads the config file.
@@ -17,7 +23,27 @@ def load_config() -> Dict:
     with open(str(config_file_path), "r") as config_file:
         return yaml.safe_load(config_file)
 
-    
+
+def json_loads(content: bytes | str) -> Any:
+    """Deserializes a JSON response body. Uses orjson if it is installed, which
+    is considerably faster for large responses, and the standard library otherwise.
+    Content orjson rejects but the standard library accepts, such as NaN values,
+    is decoded by the standard library as well.
+
+    Args:
+        content (bytes | str): The raw JSON content, e.g. the response content.
+
+    Returns:
+        Any: The deserialized content.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
 def determine_nuts_query_param(nuts_lau_code: str) -> str:
     """Determines the correct query parameter based on the given NUTS or LAU code.
 
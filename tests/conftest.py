@@ -1,10 +1,96 @@
 """
-    Dummy conftest.py for builda_client.
+    Shared fixtures for the builda_client tests.
 
-    If you don't know what this is for, just leave it empty.
-    Read more about conftest.py under:
-    - https://docs.pytest.org/en/stable/fixture.html
-    - https://docs.pytest.org/en/stable/writing_plugins.html
+    The integration tests replay recorded API responses from the cassettes in
+    tests/cassettes (see pytest-recording). ``tox -e integration`` records missing
+    cassettes, ``tox -e record`` re-records all of them.
 """
+import json
+import os
+from pathlib import Path
+from typing import Iterator
 
-# import pytest
+import pytest
+import vcr
+from dotenv import load_dotenv
+
+from builda_client.dev_client import BuildaDevClient, Phase
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+
+def _scrub_api_token(response: dict) -> dict:
+    """Replaces API tokens returned by the authentication endpoint before the
+    response is written to a cassette."""
+    body = response["body"]["string"]
+    if b'"token"' in body:
+        response["body"]["string"] = json.dumps({"token": "<API_TOKEN>"}).encode()
+    return response
+
+
+@pytest.fixture(scope="session", autouse=True)
+def load_env() -> None:
+    """Loads the API credentials from a .env file once per test session."""
+    load_dotenv()
+
+
+def _vcr_config() -> dict:
+    return {
+        "filter_headers": ["authorization"],
+        "filter_post_data_parameters": ["username", "password"],
+        "before_record_response": _scrub_api_token,
+        "match_on": ["method", "scheme", "host", "path", "query", "body"],
+        # Store decompressed bodies as JSON, which keeps the cassettes of the
+        # large statistics responses readable and considerably smaller than YAML
+        "decode_compressed_response": True,
+        "serializer": "json",
+    }
+
+
+@pytest.fixture(scope="module")
+def vcr_config() -> dict:
+    return _vcr_config()
+
+
+def _authenticate(client: BuildaDevClient, pytestconfig: pytest.Config) -> None:
+    """Fetches the API token of the given client under a cassette of its own.
+
+    The token is cached by the client, so recording the request in the cassette of
+    whichever test happens to run first would break replaying any other selection
+    of tests. The recorded token is scrubbed and only good for replaying, so it is
+    only replayed if no new responses are recorded. Otherwise a real token is
+    fetched and the cassette is recorded anew.
+    """
+    if pytestconfig.getoption("--disable-recording"):
+        client.api_token
+        return
+
+    config = _vcr_config()
+    path = CASSETTE_DIR / f"authentication.{config['serializer']}"
+    record_mode = pytestconfig.getoption("--record-mode") or "none"
+    if record_mode != "none":
+        path.unlink(missing_ok=True)
+        record_mode = "all"
+
+    with vcr.VCR(record_mode=record_mode).use_cassette(str(path), **config):
+        client.api_token
+
+
+@pytest.fixture(scope="session")
+def authed_client(load_env, pytestconfig: pytest.Config) -> Iterator[BuildaDevClient]:
+    """Development client authenticated with the credentials from the environment,
+    shared by all tests so that the API token is only fetched once."""
+    with BuildaDevClient(
+        username=os.getenv('API_USERNAME'),
+        password=os.getenv('API_PASSWORD'),
+        phase=Phase.PRODUCTION,
+    ) as client:
+        _authenticate(client, pytestconfig)
+        yield client
+
+
+@pytest.fixture(scope="session")
+def unauthed_client() -> Iterator[BuildaDevClient]:
+    """Development client without credentials."""
+    with BuildaDevClient(username=None, password=None, phase=Phase.PRODUCTION) as client:
+        yield client
@@ -0,0 +1,140 @@
+import pytest
+import responses
+
+from builda_client import client
+from builda_client.client import BuildaClient
+from builda_client.exceptions import ClientException, ServerException, UnauthorizedException
+from builda_client.model import BuildingStatistics
+
+__author__ = "k.dabrock"
+__copyright__ = "k.dabrock"
+__license__ = "MIT"
+
+OLDENBURG_LAU = '03403000'
+TYPE_STATISTICS = {
+    "nuts_code": "DE",
+    "building_count_total": 10,
+    "building_count_residential": 6,
+    "building_count_non_residential": 3,
+    "building_count_mixed": 1,
+}
+
+
+def _source(value):
+    return {"value": value, "source": "test", "lineage": "test"}
+
+
+BUILDINGS = {
+    "buildings": [
+        {
+            "id": "00000000-0000-0000-0000-000000000001",
+            "coordinates": _source({"latitude": 53.1, "longitude": 8.2}),
+            "address": _source(
+                {
+                    "street": "Schulweg",
+                    "house_number": "6B",
+                    "postcode": "26215",
+                    "city": "Wiefelstede",
+                }
+            ),
+            "footprint_area_m2": 120.5,
+            "height_m": _source(7.5),
+            "elevation_m": _source(12.0),
+            "type": _source("residential"),
+            "roof_shape": _source("gabled"),
+        }
+    ],
+    "sources": [],
+    "lineages": [],
+}
+
+
+class TestBuildaClientUnit:
+    """Unit tests for the API client with a mocked HTTP layer."""
+
+    testee: BuildaClient
+
+    @pytest.fixture(autouse=True)
+    def initialize_testee(self):
+        with BuildaClient() as client:
+            self.testee = client
+            yield
+
+    @pytest.fixture
+    def mocked_responses(self):
+        with responses.RequestsMock() as mock:
+            yield mock
+
+    def test_get_building_type_statistics_builds_query(self, mocked_responses):
+        self.__given_response(
+            mocked_responses, self.testee.TYPE_STATISTICS_URL, json=[TYPE_STATISTICS]
+        )
+        result = self.testee.get_building_type_statistics(country="DE", nuts_level=0)
+        assert mocked_responses.calls[0].request.url.endswith("?country=DE&nuts_level=0")
+        assert result == [BuildingStatistics(**TYPE_STATISTICS)]
+
+    def test_get_building_type_statistics_accepts_brotli_with_speedups(self, mocked_responses):
+        pytest.importorskip("brotli")
+        self.__given_response(mocked_responses, self.testee.TYPE_STATISTICS_URL, json=[])
+        self.testee.get_building_type_statistics(nuts_code="DE")
+        assert "br" in mocked_responses.calls[0].request.headers["Accept-Encoding"].split(", ")
+
+    def test_session_does_not_retry_reads(self):
+        retries = self.testee.session.get_adapter(self.testee.BASE_URL).max_retries
+        assert retries.connect == 3
+        assert retries.read == 0
+
+    @pytest.mark.parametrize("streamed", [True, False], ids=["ijson", "json"])
+    def test_iter_buildings_yields_buildings_of_get_buildings(
+        self, mocked_responses, monkeypatch, streamed
+    ):
+        if not streamed:
+            monkeypatch.setattr(client, "ijson", None)
+        elif client.ijson is None:
+            pytest.skip("ijson is not installed")
+        self.__given_response(
+            mocked_responses, self.testee.BUILDINGS_URL, json=BUILDINGS
+        )
+        expected = self.testee.get_buildings(nuts_code=OLDENBURG_LAU).buildings
+        assert list(self.testee.iter_buildings(nuts_code=OLDENBURG_LAU)) == expected
+
+    def test_iter_buildings_releases_connection_on_error_status(
+        self, mocked_responses, monkeypatch
+    ):
+        self.__given_response(mocked_responses, self.testee.BUILDINGS_URL, status=500)
+        received = []
+        session_get = self.testee.session.get
+
+        def get(*args, **kwargs):
+            received.append(session_get(*args, **kwargs))
+            return received[-1]
+
+        monkeypatch.setattr(self.testee.session, "get", get)
+        with pytest.raises(ServerException):
+            next(self.testee.iter_buildings(nuts_code=OLDENBURG_LAU))
+        assert received[0].raw.closed
+
+    def test_get_building_type_statistics_with_nuts_level_and_code_raises_value_error(self):
+        with pytest.raises(ValueError):
+            self.testee.get_building_type_statistics(nuts_level=0, nuts_code="DE")
+
+    @pytest.mark.parametrize(
+        "status,exception",
+        [
+            (403, UnauthorizedException),
+            (404, ClientException),
+            (500, ServerException),
+        ],
+    )
+    def test_get_building_type_statistics_maps_error_status(
+        self, mocked_responses, status, exception
+    ):
+        self.__given_response(
+            mocked_responses, self.testee.TYPE_STATISTICS_URL, status=status
+        )
+        with pytest.raises(exception):
+            self.testee.get_building_type_statistics(nuts_code="DE")
+
+    # GIVEN
+    def __given_response(self, mocked_responses, endpoint: str, **kwargs):
+        mocked_responses.get(f"{self.testee.BASE_URL}{endpoint}", **kwargs)
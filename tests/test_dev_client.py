@@ -1,117 +1,98 @@
-import os
 from typing import Any
 
-import pandas as pd
 import pytest
 
-from builda_client.dev_client import BuildaDevClient, Phase
+from builda_client.dev_client import BuildaDevClient
 from builda_client.dev_model import (BuildingParcel, NutsRegion)
-from dotenv import load_dotenv
-
-load_dotenv()
+from builda_client.exceptions import MissingCredentialsException
 
 __author__ = "k.dabrock"
 __copyright__ = "k.dabrock"
 __license__ = "MIT"
 
+NUTS_CASES = [
+    (0, "DE", 1),
+    pytest.param(1, "DE", 16, marks=pytest.mark.slow),
+]
+
+@pytest.mark.integration
+@pytest.mark.vcr
 class TestDevBuildaClient:
     """Integration tests for API client development methods.
     """
 
     testee: BuildaDevClient
 
+    @pytest.fixture(autouse=True)
+    def initialize_testee(self, authed_client: BuildaDevClient):
+        self.testee = authed_client
+
     def test_get_building_ids(self):
-        self.__given_client_authenticated()
         building_ids = self.testee.get_building_ids(nuts_code='01058007', type='residential')
         self.__then_result_list_min_length_returned(building_ids, 1)
 
-    def test_get_buildings_type_residential(self):
-        self.__given_client_authenticated()
-        buildings = self.testee.get_buildings(
-            building_type="residential", nuts_code='01058007'
-        )
-        self.__then_result_list_min_length_returned(buildings, 1)
-        assert all(pd.DataFrame(buildings)["type"] == 'residential')
-
-    def test_get_buildings_type_non_residential(self):
-        self.__given_client_authenticated()
-        buildings = self.testee.get_buildings(
-            building_type="non-residential", nuts_code='01058007'
-        )
-        self.__then_result_list_min_length_returned(buildings, 1)
-        assert all(pd.DataFrame(buildings)["type"] == 'non-residential')
-
-    def test_get_buildings_type_mixed(self):
-        self.__given_client_authenticated()
+    @pytest.mark.parametrize(
+        "building_type,nuts_code",
+        [
+            ("residential", '01058007'),
+            ("non-residential", '01058007'),
+            ("mixed", 'DE943'),
+        ],
+    )
+    def test_get_buildings_by_type(self, building_type, nuts_code):
         buildings = self.testee.get_buildings(
-            building_type="mixed", nuts_code='DE943'
+            building_type=building_type, nuts_code=nuts_code
         )
         self.__then_result_list_min_length_returned(buildings, 1)
-        assert all(pd.DataFrame(buildings)["type"] == 'mixed')
+        self.__then_buildings_of_types_returned(buildings, {building_type})
 
     def test_get_residential_buildings(self):
-        self.__given_client_authenticated()
         buildings = self.testee.get_residential_buildings(nuts_code='01058007')
         self.__then_result_list_min_length_returned(buildings, 1)
 
     
     def test_get_residential_buildings_with_sources(self):
-        self.__given_client_authenticated()
         buildings = self.testee.get_residential_buildings_with_sources(nuts_code='01058007')
         self.__then_result_list_min_length_returned(buildings.buildings, 1)
 
     def test_get_non_residential_buildings_exclude_auxiliary(self):
-        self.__given_client_authenticated()
         non_residential_buildings = self.testee.get_non_residential_buildings(exclude_auxiliary=True, nuts_code='01058007')
-        assert (pd.json_normalize(pd.DataFrame(non_residential_buildings)['use'])['sector'] == 'auxiliary').sum() == 0
+        assert not any(b.use['sector'] == 'auxiliary' for b in non_residential_buildings)
 
-    def test_get_buildings_geometry_with_no_type(self):
-        self.__given_client_authenticated()
-        buildings = self.testee.get_buildings_geometry(building_type=None, nuts_code='01058007')
-        assert all([b.type is None for b in buildings])
-
-    def test_get_buildings_geometry_type_mixed(self):
-        self.__given_client_authenticated()
-        buildings = self.testee.get_buildings_geometry(building_type="mixed", nuts_code='01058007')
-        assert all([b.type == "mixed" for b in buildings])
-
-    def test_get_buildings_geometry_all_types(self):
-        self.__given_client_authenticated()
-        buildings = self.testee.get_buildings_geometry(building_type="", nuts_code='01058007')
-        assert all([b.type in ["residential", "non-residential", "mixed", None] for b in buildings])
+    @pytest.mark.parametrize(
+        "building_type,expected_types",
+        [
+            (None, {None}),
+            ("mixed", {"mixed"}),
+            ("", {"residential", "non-residential", "mixed", None}),
+        ],
+        ids=["no_type", "mixed", "all_types"],
+    )
+    def test_get_buildings_geometry_by_type(self, building_type, expected_types):
+        buildings = self.testee.get_buildings_geometry(building_type=building_type, nuts_code='01058007')
+        self.__then_buildings_of_types_returned(buildings, expected_types)
 
     def test_get_nuts_region(self):
-        self.__given_client_authenticated()
         result = self.testee.get_nuts_region("01058007")
         self.__then_nuts_region_with_code_returned(result, "01058007")
 
     def test_get_building_parcel_succeeds(self):
-        self.__given_client_authenticated()
         building_parcel = self.testee.get_buildings_parcel(nuts_code="01058007")
         self.__then_buildings_with_parcel_returned(building_parcel)
 
     def test_get_nuts_children_succeeds(self):
-        self.__given_client_authenticated()
         nuts_regions = self.testee.get_children_nuts_codes("DE")
         self.then_result_list_correct_length_returned(nuts_regions, 16)
 
     def test_get_buildings_base_no_type(self):
-        self.__given_client_authenticated()
         buildings = self.testee.get_buildings_base(nuts_code='01058007')
         self.__then_result_list_min_length_returned(buildings, 1)
 
 
-    @pytest.mark.parametrize(
-        "nuts_level,country,expected_min_count",
-        [
-            (0, "DE", 1),
-            (1, "DE", 16),
-        ],
-    )
+    @pytest.mark.parametrize("nuts_level,country,expected_min_count", NUTS_CASES)
     def test_get_non_residential_energy_consumption_statistics_succeeds(
         self, nuts_level, country, expected_min_count
     ):
-        self.__given_client_authenticated()
         energy_consumption_statistics = (
             self.testee.get_non_residential_energy_consumption_statistics(
                 nuts_level=nuts_level,
@@ -123,11 +104,8 @@ class TestDevBuildaClient:
         )
 
 
-    @pytest.mark.parametrize(
-        "nuts_level,country,expected_count", [(0, "DE", 1), (1, "DE", 16)]
-    )
+    @pytest.mark.parametrize("nuts_level,country,expected_count", NUTS_CASES)
     def test_get_pv_potential_statistics_succeeds(self, nuts_level, country, expected_count):
-        self.__given_client_authenticated()
         height_statistics = self.testee.get_pv_potential_statistics(
             nuts_level=nuts_level, country=country
         )
@@ -135,14 +113,11 @@ class TestDevBuildaClient:
             height_statistics, expected_count
         )
 
-    # GIVEN
-    def __given_client_authenticated(self, proxy: bool = False) -> None:
-        username = os.getenv('API_USERNAME')
-        password = os.getenv('API_PASSWORD')
-        self.testee = BuildaDevClient(proxy=proxy, username=username, password=password, phase=Phase.PRODUCTION)
-
-    
     # THEN
+    def __then_buildings_of_types_returned(self, buildings, expected_types: set[str | None]):
+        unexpected = next((b for b in buildings if b.type not in expected_types), None)
+        assert unexpected is None, f"building {unexpected.id} of type {unexpected.type} returned"
+
     def __then_nuts_region_with_code_returned(self, result, code):
         assert isinstance(result, NutsRegion)
         assert result.code == code
@@ -155,11 +130,35 @@ class TestDevBuildaClient:
     def then_result_list_correct_length_returned(
         self, result_list: list[Any], expected_length: int
     ):
-        assert result_list
         assert len(result_list) == expected_length
 
     def __then_result_list_min_length_returned(
         self, result_list: list[Any], expected_min_length: int
     ):
-        assert result_list
-        assert len(result_list) >= expected_min_length
\ No newline at end of file
+        assert len(result_list) >= expected_min_length
+
+
+class TestDevBuildaClientUnauthenticated:
+    """Tests for private API client methods called without credentials.
+
+    The client rejects these calls before sending a request, so no cassettes
+    are needed.
+    """
+
+    testee: BuildaDevClient
+
+    @pytest.fixture(autouse=True)
+    def initialize_testee(self, unauthed_client: BuildaDevClient):
+        self.testee = unauthed_client
+
+    def test_refresh_buildings_raises_missing_credentials_exception(self):
+        with pytest.raises(MissingCredentialsException):
+            self.testee.refresh_buildings('residential')
+
+    def test_post_building_stock_raises_missing_credentials_exception(self):
+        with pytest.raises(MissingCredentialsException):
+            self.testee.post_building_stock([])
+
+    def test_get_building_stock_raises_missing_credentials_exception(self):
+        with pytest.raises(MissingCredentialsException):
+            self.testee.get_building_stock(nuts_code='DE')
@@ -0,0 +1,55 @@
+import json
+from uuid import UUID
+
+import pytest
+import responses
+from shapely.geometry import Polygon
+
+from builda_client.dev_client import BuildaDevClient, Phase
+from builda_client.dev_model import Parcel
+
+__author__ = "k.dabrock"
+__copyright__ = "k.dabrock"
+__license__ = "MIT"
+
+UNIT_TRIANGLE = Polygon(((0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (0.0, 0.0)))
+# The posts are mocked, so fixed ids suffice and keep the request bodies stable
+PARCELS = [Parcel(id=UUID(int=i), shape=UNIT_TRIANGLE) for i in range(1000)]
+
+
+class TestDevBuildaClientUnit:
+    """Unit tests for the development API client with a mocked HTTP layer."""
+
+    testee: BuildaDevClient
+
+    @pytest.fixture
+    def mocked_responses(self):
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+            yield mock
+
+    @pytest.fixture(autouse=True)
+    def initialize_testee(self, mocked_responses):
+        with BuildaDevClient(
+            username="user", password="secret", phase=Phase.PRODUCTION
+        ) as client:
+            self.testee = client
+            mocked_responses.post(client.authentication_url, json={"token": "abc"})
+            yield
+
+    def test_init_does_not_authenticate(self, mocked_responses):
+        assert len(mocked_responses.calls) == 0
+
+    def test_api_token_is_fetched_once(self, mocked_responses):
+        assert self.testee.api_token == "abc"
+        assert self.testee.api_token == "abc"
+        assert len(mocked_responses.calls) == 1
+
+    def test_add_parcels_posts_all_parcels_at_once(self, mocked_responses):
+        mocked_responses.post(f"{self.testee.base_url}{self.testee.PARCEL_URL}")
+        self.testee.add_parcels(PARCELS)
+        parcel_posts = [
+            call for call in mocked_responses.calls
+            if call.request.url.endswith(self.testee.PARCEL_URL)
+        ]
+        assert len(parcel_posts) == 1
+        assert len(json.loads(parcel_posts[0].request.body)) == len(PARCELS)
@@ -1,19 +1,43 @@
-from typing import Tuple
+from pathlib import Path
+from typing import Iterator, Tuple
 from builda_client.nominatim_client import NominatimClient
 from builda_client.nominatim_client import GeocodeException
 import pytest
+from requests_cache import CachedSession
 
 __author__ = "k.dabrock"
 __copyright__ = "k.dabrock"
 __license__ = "MIT"
 
+# On-disk cache of reverse geocoding responses, shared across test runs
+RESPONSE_CACHE = Path(__file__).parent / ".cache" / "nominatim"
+
+
+@pytest.fixture(scope="module")
+def client() -> Iterator[NominatimClient]:
+    """Geocoding client shared by the tests of this module, reading responses
+    from the on-disk cache for a day."""
+    with NominatimClient() as client:
+        session = CachedSession(
+            cache_name=str(RESPONSE_CACHE), backend="sqlite", expire_after=86400
+        )
+        # Closing only empties the connection pools of the client's session, so
+        # its pooled, retrying adapters can be moved to the cached session
+        client.session.close()
+        for prefix, adapter in client.session.adapters.items():
+            session.mount(prefix, adapter)
+        client.session = session
+        yield client
+
+
+@pytest.mark.integration
 class TestNominatimClient:
 
     testee: NominatimClient
 
     @pytest.fixture(autouse=True)
-    def initialize_testee(self):
-        self.testee = NominatimClient()
+    def initialize_testee(self, client: NominatimClient):
+        self.testee = client
 
     @pytest.mark.parametrize("city_test_case", ['Aachen', 'Arpsdorf'])
     def test_get_address_succeeds(self, city_test_case):
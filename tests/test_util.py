@@ -0,0 +1,35 @@
+import json
+import math
+
+import pytest
+
+from builda_client import util
+from builda_client.util import json_loads
+
+__author__ = "k.dabrock"
+__copyright__ = "k.dabrock"
+__license__ = "MIT"
+
+
+class TestJsonLoads:
+    """Unit tests for the JSON decoding of response bodies."""
+
+    @pytest.fixture(params=[True, False], ids=["orjson", "json"])
+    def decoder(self, request, monkeypatch):
+        if not request.param:
+            monkeypatch.setattr(util, "orjson", None)
+        elif util.orjson is None:
+            pytest.skip("orjson is not installed")
+
+    def test_json_loads_decodes_content(self, decoder):
+        assert json_loads(b'[{"nuts_code": "DE", "count": 1}]') == [
+            {"nuts_code": "DE", "count": 1}
+        ]
+
+    def test_json_loads_decodes_nan(self, decoder):
+        result = json_loads(b'[{"avg_height_m": NaN}]')
+        assert math.isnan(result[0]["avg_height_m"])
+
+    def test_json_loads_raises_on_invalid_content(self, decoder):
+        with pytest.raises(json.JSONDecodeError):
+            json_loads(b'[{"nuts_code": ')